@@ -198,6 +198,30 @@ class MultiBidict(Generic[_KT, _VT]):
             self.__inv_dict[value] = set()
         self.__inv_dict[value].add(key)
 
+    def insert_keys(self, keys: set[_KT], value: _VT) -> None:
+        """
+        Insert the given value with each of the specified keys into the dictionary in a single batch.
+
+        :param keys: A set of keys to which the value will be associated.
+        :param value: The value to be inserted for the keys.
+        :return: None.
+        """
+        # Skip the insertion if there are no keys, so that
+        # the value is not registered without associations
+        if not keys:
+            return
+
+        # Add the value to each key's set
+        for key in keys:
+            if key not in self.__fwd_dict:
+                self.__fwd_dict[key] = set()
+            self.__fwd_dict[key].add(value)
+
+        # Add all the keys to the value's set at once
+        if value not in self.__inv_dict:
+            self.__inv_dict[value] = set()
+        self.__inv_dict[value].update(keys)
+
     def remove(self, key: _KT, value: _VT) -> None:
         """
         Remove the specified value from the given key.
@@ -264,6 +288,35 @@ class MultiBidict(Generic[_KT, _VT]):
             if not self.__fwd_dict[key]:
                 self.__fwd_dict.pop(key)
 
+    def remove_values(self, values: set[_VT]) -> None:
+        """
+        Remove the specified values from the dictionary in a single batch.
+
+        :param values: A set of values to be removed from the dictionary.
+        :return: None.
+        :raises KeyError: If any of the values is not registered.
+        """
+        # Ensure that all the values are registered before removing any of
+        # them, so that the dictionary is left unchanged if any is missing
+        missing_values: set[_VT] = values - self.__inv_dict.keys()
+        if missing_values:
+            raise KeyError(next(iter(missing_values)))
+
+        # Remove the values and collect all their associated keys
+        keys: set[_KT] = set()
+        for value in values:
+            keys.update(self.__inv_dict.pop(value))
+
+        # Remove the values from each affected key's set at once
+        for key in keys:
+            key_values: set[_VT] = self.__fwd_dict[key]
+            key_values.difference_update(values)
+
+            # If the key is no longer associated with
+            # any values, remove it from the dictionary
+            if not key_values:
+                self.__fwd_dict.pop(key)
+
     def pop_key(self, key: _KT) -> set[_VT]:
         """
         Remove the specified key from the dictionary and returns the associated values.
@@ -1,11 +1,34 @@
+import sys
 from asyncio import Task, create_task, gather, get_running_loop, run
+from collections.abc import Coroutine
 from typing import Any
 
 from typing_extensions import override
 
+from ...exceptions import PyventusException
 from ...utils import attributes_repr, formatted_repr, is_callable_async
 from ..processing_service import ProcessingService, ProcessingServiceCallbackType
 
+if sys.version_info >= (3, 12):  # pragma: no cover
+
+    def _create_eager_task(coro: Coroutine[Any, Any, Any]) -> Task[Any]:
+        """
+        Create a task that starts executing the given coroutine immediately.
+
+        If the running event loop has a custom task factory, the task is created through
+        that factory instead, so it is honored and decides how the task is started.
+
+        :param coro: The coroutine to be wrapped in a task.
+        :return: The created task.
+        """
+        loop = get_running_loop()
+        if loop.get_task_factory() is not None:
+            return loop.create_task(coro)
+        return Task(coro, loop=loop, eager_start=True)
+
+else:  # pragma: no cover
+    _create_eager_task = create_task
+
 
 class AsyncIOProcessingService(ProcessingService):
     """
@@ -24,6 +47,12 @@ class AsyncIOProcessingService(ProcessingService):
     -   When the provided callback is an asynchronous call and is submitted in a context where no event loop is
         active, a new event loop is started and subsequently closed by the `asyncio.run()` method. Within this
         loop, the callback is executed, and the loop waits for all scheduled tasks to finish before closing.
+
+    -   When `eager_start` is enabled and the service runs on Python 3.12 or later, asynchronous callbacks
+        submitted to a running event loop start executing immediately and are only suspended on their first
+        blocking await, saving a full event loop iteration for callbacks that complete synchronously. On
+        earlier Python versions, this flag has no effect. If the running loop has a custom task factory,
+        tasks are still created through it, and whether they start eagerly is up to that factory.
     """
 
     @staticmethod
@@ -40,17 +69,27 @@ class AsyncIOProcessingService(ProcessingService):
             return False
 
     # Attributes for the AsyncIOProcessingService
-    __slots__ = ("__background_tasks",)
+    __slots__ = ("__background_tasks", "__eager_start")
 
-    def __init__(self) -> None:
+    def __init__(self, eager_start: bool = False) -> None:
         """
         Initialize an instance of `AsyncIOProcessingService`.
 
+        :param eager_start: Determines whether asynchronous callbacks submitted to a running event
+            loop should start executing eagerly (Python 3.12+). Defaults to `False`.
         :return: None.
+        :raises PyventusException: If the `eager_start` argument is not a boolean.
         """
+        # Validate the eager_start argument
+        if not isinstance(eager_start, bool):
+            raise PyventusException("The 'eager_start' argument must be a boolean value.")
+
         # Initialize the set of background tasks
         self.__background_tasks: set[Task[Any]] = set()
 
+        # Store the eager start flag
+        self.__eager_start: bool = eager_start
+
     def __repr__(self) -> str:
         """
         Retrieve a string representation of the instance.
@@ -61,6 +100,7 @@ class AsyncIOProcessingService(ProcessingService):
             instance=self,
             info=attributes_repr(
                 background_tasks=self.__background_tasks,
+                eager_start=self.__eager_start,
             ),
         )
 
@@ -72,8 +112,13 @@ class AsyncIOProcessingService(ProcessingService):
             loop_running: bool = AsyncIOProcessingService.is_loop_running()
 
             if loop_running:
-                # Schedule the callback in the running loop as a background task.
-                task: Task[Any] = create_task(callback(*args, **kwargs))
+                # Schedule the callback in the running loop as a background task,
+                # starting it eagerly if the eager start mode is enabled.
+                task: Task[Any] = (
+                    _create_eager_task(callback(*args, **kwargs))
+                    if self.__eager_start
+                    else create_task(callback(*args, **kwargs))
+                )
 
                 # Add a callback to remove the Task from the set of background tasks upon completion.
                 task.add_done_callback(self.__background_tasks.discard)
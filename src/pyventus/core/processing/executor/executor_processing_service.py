@@ -1,7 +1,11 @@
-from asyncio import run
+from asyncio import AbstractEventLoop, all_tasks, gather, new_event_loop
+from collections.abc import AsyncGenerator, Awaitable
 from concurrent.futures import Executor
+from sys import get_asyncgen_hooks, set_asyncgen_hooks
+from threading import current_thread, local
 from types import TracebackType
 from typing import Any
+from weakref import WeakSet, finalize
 
 from typing_extensions import Self, override
 
@@ -9,6 +13,82 @@ from ...exceptions import PyventusException
 from ...utils import attributes_repr, formatted_repr, is_callable_async
 from ..processing_service import ProcessingService, ProcessingServiceCallbackType
 
+_thread_local: local = local()
+"""A thread-local storage that holds the asyncio event loop of each worker thread."""
+
+
+async def _await_tracking_asyncgens(awaitable: Awaitable[Any], asyncgens: WeakSet[AsyncGenerator[Any, Any]]) -> None:
+    """
+    Await the given awaitable while tracking the asynchronous generators started during its execution.
+
+    The hooks of the running event loop are chained rather than replaced, so the generators
+    remain managed by the event loop as well. The hooks are restored by the event loop once
+    it stops running.
+
+    :param awaitable: The awaitable to be awaited.
+    :param asyncgens: The set where the started asynchronous generators are stored.
+    :return: None.
+    """
+    firstiter, finalizer = get_asyncgen_hooks()
+
+    def firstiter_hook(asyncgen: AsyncGenerator[Any, Any]) -> None:
+        asyncgens.add(asyncgen)
+        if firstiter is not None:
+            firstiter(asyncgen)
+
+    set_asyncgen_hooks(firstiter=firstiter_hook, finalizer=finalizer)
+    await awaitable
+
+
+async def _close_asyncgens(asyncgens: list[AsyncGenerator[Any, Any]]) -> None:
+    """
+    Close the given asynchronous generators concurrently, ignoring any errors raised while closing them.
+
+    :param asyncgens: The asynchronous generators to be closed.
+    :return: None.
+    """
+    await gather(*[asyncgen.aclose() for asyncgen in asyncgens], return_exceptions=True)
+
+
+def _run_in_thread_event_loop(awaitable: Awaitable[Any]) -> None:
+    """
+    Run the given awaitable to completion in the asyncio event loop of the current thread.
+
+    The event loop is created on first use and reused by subsequent calls from the same
+    thread, avoiding the cost of creating and tearing down a loop for every callback. As
+    with `asyncio.run()`, any tasks left pending by the awaitable are cancelled afterwards,
+    and any asynchronous generators it left suspended are closed. The event loop is closed
+    once the thread object is garbage collected.
+
+    :param awaitable: The awaitable to be run.
+    :return: None.
+    """
+    # Retrieve the event loop of the current thread, creating a new one if needed.
+    loop: AbstractEventLoop | None = getattr(_thread_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = new_event_loop()
+        finalize(current_thread(), loop.close)
+        _thread_local.loop = loop
+
+    # The asynchronous generators started by the awaitable. The event loop's own
+    # shutdown_asyncgens() is not used, as it would prevent the loop from being reused.
+    asyncgens: WeakSet[AsyncGenerator[Any, Any]] = WeakSet()
+
+    try:
+        # Run the awaitable until it is complete.
+        loop.run_until_complete(_await_tracking_asyncgens(awaitable, asyncgens))
+    finally:
+        # Cancel the remaining tasks, if any, and wait for them to finish.
+        pending = all_tasks(loop)
+        if pending:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(gather(*pending, return_exceptions=True))
+
+        # Close the asynchronous generators left suspended, if any.
+        if asyncgens:
+            loop.run_until_complete(_close_asyncgens(list(asyncgens)))
+
 
 class ExecutorProcessingService(ProcessingService):
     """
@@ -21,7 +101,8 @@ class ExecutorProcessingService(ProcessingService):
         for process-based execution.
 
     -   Synchronous callbacks are executed in a blocking manner inside the executor, while asynchronous
-        callbacks are processed within a new asyncio event loop using the `asyncio.run()` function.
+        callbacks are processed within an asyncio event loop. Each worker thread creates its own event
+        loop on first use and reuses it for later callbacks, instead of creating a new one every time.
 
     -   When using this service, it is important to properly manage the underlying `Executor`. Once
         there are no more calls to be processed through the given executor, it's important to invoke
@@ -44,8 +125,8 @@ class ExecutorProcessingService(ProcessingService):
         """
         # Check if the callback is asynchronous and execute accordingly.
         if is_callable_async(callback):
-            # Run the async callback in a new asyncio event loop.
-            run(callback(*args, **kwargs))
+            # Run the async callback in the asyncio event loop of the current thread.
+            _run_in_thread_event_loop(callback(*args, **kwargs))
         else:
             # Run the sync callback directly with the provided arguments.
             callback(*args, **kwargs)
@@ -1,3 +1,6 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from threading import local
 from typing import Any
 
 from typing_extensions import override
@@ -25,10 +28,14 @@ class RedisProcessingService(ProcessingService):
 
     -   Synchronous callbacks are executed in a blocking manner inside the worker, while asynchronous
         callbacks are processed within a new asyncio event loop using the `asyncio.run()` function.
+
+    -   By default, each submission is sent to Redis in its own round trip. When many callbacks are
+        submitted in a burst, the `batch()` context manager can be used to pipeline them and send all
+        of them to Redis in a single round trip when the context exits.
     """
 
     # Attributes for the RedisProcessingService
-    __slots__ = ("__queue", "__options")
+    __slots__ = ("__queue", "__options", "__thread_local")
 
     def __init__(self, queue: Queue, options: dict[str, Any] | None = None) -> None:
         """
@@ -49,6 +56,9 @@ class RedisProcessingService(ProcessingService):
         self.__queue: Queue = queue
         self.__options: dict[str, Any] = options if options else {}
 
+        # Create a thread-local storage for the pipeline used by batched submissions.
+        self.__thread_local: local = local()
+
     def __repr__(self) -> str:
         """
         Retrieve a string representation of the instance.
@@ -65,5 +75,41 @@ class RedisProcessingService(ProcessingService):
 
     @override
     def submit(self, callback: ProcessingServiceCallbackType, *args: Any, **kwargs: Any) -> None:
-        # Send the callback and its arguments to Redis for asynchronous execution.
-        self.__queue.enqueue(callback, *args, **kwargs, **self.__options)
+        # Retrieve the pipeline of the current batch, if any.
+        pipeline: Any = getattr(self.__thread_local, "pipeline", None)
+
+        if pipeline is None:
+            # Send the callback and its arguments to Redis for asynchronous execution.
+            self.__queue.enqueue(callback, *args, **kwargs, **self.__options)
+        else:
+            # Queue the callback and its arguments in the pipeline until the batch is sent. The
+            # options are merged first, so the batch pipeline replaces any pipeline set in them.
+            self.__queue.enqueue(callback, *args, **kwargs, **{**self.__options, "pipeline": pipeline})
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """
+        Context manager that groups the submissions made within its block into a single Redis round trip.
+
+        Submissions made by the current thread within the context are accumulated in a Redis pipeline,
+        which is executed once the context exits, even if an exception was raised. Nested calls join
+        the outermost batch. Within the batch, its pipeline takes precedence over any `pipeline` set
+        in the RQ options.
+
+        :return: None.
+        """
+        # If a batch is already in progress in this thread, join it.
+        if getattr(self.__thread_local, "pipeline", None) is not None:
+            yield
+            return
+
+        # Create a new pipeline for the submissions of this batch.
+        pipeline: Any = self.__queue.connection.pipeline()
+        self.__thread_local.pipeline = pipeline
+
+        try:
+            yield
+        finally:
+            # Stop batching and send all the queued submissions to Redis at once.
+            self.__thread_local.pipeline = None
+            pipeline.execute()
@@ -1,15 +1,16 @@
 from asyncio import gather
 from datetime import datetime
 from sys import gettrace
+from time import time_ns
 from types import EllipsisType
-from typing import Any, TypeAlias, final
+from typing import Any, TypeAlias, cast, final
 from uuid import uuid4
 
 from ...core.exceptions import PyventusException
 from ...core.loggers import Logger, StdOutLogger
 from ...core.processing import ProcessingService
 from ...core.utils import attributes_repr, formatted_repr, summarized_repr
-from ..linkers import EventLinker
+from ..linkers import EventLinker, SubscribableEventType
 from ..subscribers import EventSubscriber
 
 EmittableEventType: TypeAlias = str | Exception | object | EllipsisType
@@ -43,12 +44,12 @@ class EventEmitter:
         """
 
         # Attributes for the EventEmission
-        __slots__ = ("__id", "__event", "__subscribers", "__args", "__kwargs", "__timestamp", "__debug")
+        __slots__ = ("__id", "__event", "__subscribers", "__args", "__kwargs", "__timestamp_ns", "__debug", "__repr")
 
         def __init__(
             self,
             event: str,
-            subscribers: set[EventSubscriber],
+            subscribers: tuple[EventSubscriber, ...],
             args: tuple[Any, ...],
             kwargs: dict[str, Any],
             debug: bool,
@@ -57,7 +58,7 @@ class EventEmitter:
             Initialize an instance of `EventEmission`.
 
             :param event: The name of the event being emitted.
-            :param subscribers: A set of subscribers associated with the event.
+            :param subscribers: A tuple of unique subscribers associated with the event.
             :param args: Positional arguments containing event-specific data.
             :param kwargs: Keyword arguments containing event-specific data.
             :param debug: Indicates whether debug mode is enabled.
@@ -69,40 +70,51 @@ class EventEmitter:
                 raise PyventusException("The 'subscribers' argument cannot be None or empty.")
 
             # Define and set the event emission attributes
-            self.__id: str = str(uuid4())
+            self.__id: str | None = None
             self.__event: str = event
-            self.__subscribers: set[EventSubscriber] = subscribers
+            self.__subscribers: tuple[EventSubscriber, ...] = subscribers
             self.__args: tuple[Any, ...] = args
             self.__kwargs: dict[str, Any] = kwargs
-            self.__timestamp: datetime = datetime.now()
+            self.__timestamp_ns: int = time_ns()
             self.__debug: bool = debug
+            self.__repr: str | None = None
 
         def __repr__(self) -> str:
             """
             Retrieve a string representation of the instance.
 
+            The representation is built on first access and cached, since the emission data
+            does not change and it is logged both when emitted and when executed.
+
             :return: A string representation of the instance.
             """
-            return formatted_repr(
-                instance=self,
-                info=attributes_repr(
-                    id=self.__id,
-                    event=self.__event,
-                    subscribers=self.__subscribers,
-                    args=self.__args,
-                    kwargs=self.__kwargs,
-                    timestamp=self.__timestamp.strftime("%Y-%m-%d %I:%M:%S %p"),
-                    debug=self.__debug,
-                ),
-            )
+            if self.__repr is None:
+                self.__repr = formatted_repr(
+                    instance=self,
+                    info=attributes_repr(
+                        id=self.id,
+                        event=self.__event,
+                        subscribers=self.__subscribers,
+                        args=self.__args,
+                        kwargs=self.__kwargs,
+                        timestamp=self.timestamp.strftime("%Y-%m-%d %I:%M:%S %p"),
+                        debug=self.__debug,
+                    ),
+                )
+            return self.__repr
 
         @property
-        def id(self) -> str:  # pragma: no cover
+        def id(self) -> str:
             """
             Retrieve the unique identifier of the event emission.
 
+            The identifier is generated on first access, so that emissions whose
+            identifier is never read do not pay for generating it.
+
             :return: The unique identifier of the event emission.
             """
+            if self.__id is None:
+                self.__id = str(uuid4())
             return self.__id
 
         @property
@@ -115,13 +127,18 @@ class EventEmitter:
             return self.__event
 
         @property
-        def timestamp(self) -> datetime:  # pragma: no cover
+        def timestamp(self) -> datetime:
             """
             Retrieve the timestamp when the event emission was created.
 
+            The timestamp is captured as an integer number of nanoseconds and only
+            converted to a `datetime` object on demand, keeping the emission cheap.
+
             :return: The timestamp when the event emission was created.
             """
-            return self.__timestamp
+            # Split the nanoseconds with integer arithmetic, so that no precision is lost
+            seconds, nanoseconds = divmod(self.__timestamp_ns, 1_000_000_000)
+            return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1_000)
 
         async def __call__(self) -> None:
             """
@@ -133,17 +150,41 @@ class EventEmitter:
             if self.__debug:
                 StdOutLogger.debug(source=summarized_repr(self), action="Executing:", msg=f"{self}")
 
-            # Execute the subscribers concurrently
-            await gather(
-                *[subscriber.execute(*self.__args, **self.__kwargs) for subscriber in self.__subscribers],
-                return_exceptions=True,
-            )
+            # Bind the event data to locals so the per-subscriber
+            # calls below do not look them up on the instance each time
+            args: tuple[Any, ...] = self.__args
+            kwargs: dict[str, Any] = self.__kwargs
+
+            if len(self.__subscribers) == 1:
+                # With a single subscriber there is nothing to run concurrently, so await it
+                # directly and avoid wrapping it in a task and gathering its result. Errors
+                # raised by the success or failure callbacks are suppressed, just as they
+                # are when gathering the results with `return_exceptions=True`.
+                try:
+                    await self.__subscribers[0].execute(*args, **kwargs)
+                except Exception:
+                    pass
+            else:
+                # Execute the subscribers concurrently
+                await gather(
+                    *[subscriber.execute(*args, **kwargs) for subscriber in self.__subscribers],
+                    return_exceptions=True,
+                )
 
             # Perform cleanup by deleting unnecessary references
-            del self.__id, self.__event, self.__subscribers, self.__args, self.__kwargs, self.__timestamp, self.__debug
+            del (
+                self.__id,
+                self.__event,
+                self.__subscribers,
+                self.__args,
+                self.__kwargs,
+                self.__timestamp_ns,
+                self.__debug,
+                self.__repr,
+            )
 
     # Attributes for the EventEmitter.
-    __slots__ = ("__event_processor", "__event_linker", "__logger")
+    __slots__ = ("__event_processor", "__event_linker", "__logger", "__emit_cache")
 
     def __init__(
         self,
@@ -183,6 +224,11 @@ class EventEmitter:
         # Create and store logger.
         self.__logger: Logger = Logger(source=self, debug=debug if debug is not None else bool(gettrace() is not None))
 
+        # Initialize the cache of subscriber lookups, keyed by event name and paired with the version
+        # of the event linker registry they were built from. The whole cache is discarded as soon as
+        # the registry changes, so it never holds on to removed subscribers.
+        self.__emit_cache: tuple[int, dict[str, tuple[EventSubscriber, ...]]] = (-1, {})
+
     def __repr__(self) -> str:
         """
         Retrieve a string representation of the instance.
@@ -198,6 +244,23 @@ class EventEmitter:
             ),
         )
 
+    def _log_emission(self, event_name: str, event_emission: "EventEmitter.EventEmission | None") -> None:
+        """
+        Log the emission of an event.
+
+        The debug messages are built here rather than inline so that the `emit()`
+        method, which is on the hot path, stays compact when debug mode is disabled.
+
+        :param event_name: The name of the emitted event.
+        :param event_emission: The event emission to be propagated, or `None` if
+            there are no subscribers registered for the event.
+        :return: None.
+        """
+        if event_emission is None:
+            self.__logger.debug(action="Emitting:", msg=f"No subscribers registered for the event '{event_name}'.")
+        else:
+            self.__logger.debug(action="Emitting:", msg=f"{event_emission}")
+
     def emit(self, /, event: EmittableEventType, *args: Any, **kwargs: Any) -> None:
         """
         Emit an event and notifies all registered subscribers.
@@ -225,35 +288,63 @@ class EventEmitter:
         if isinstance(event, type):
             raise PyventusException("The 'event' argument cannot be a type.")
 
+        # Bind the event linker and the debug flag to locals, as they are used several times below.
+        event_linker: type[EventLinker] = self.__event_linker
+        debug: bool = self.__logger.debug_enabled
+
+        # Determine once whether the event is a named event (a string or the Ellipsis) or an event object.
+        # The exact type comparison covers the common string case before falling back to isinstance().
+        is_named_event: bool = type(event) is str or event is Ellipsis or isinstance(event, str)
+
         # Get the valid event name
-        event_name: str = self.__event_linker.get_valid_event_name(
-            event=(event if isinstance(event, str | EllipsisType) else type(event))
+        event_name: str = event_linker.get_valid_event_name(
+            event=(cast(SubscribableEventType, event) if is_named_event else type(event))
         )
 
-        # Get the set of subscribers associated with the event, removing one-time subscribers.
-        subscribers: set[EventSubscriber] = self.__event_linker.get_subscribers_from_events(
-            event_name, Ellipsis, pop_onetime_subscribers=True
-        )
+        # Retrieve the current registry version before the lookup, so that any
+        # concurrent modification invalidates the cached entry on the next emission.
+        version: int = event_linker.get_version()
+
+        # Discard the cached subscribers if the registry has changed since they were retrieved. The cache
+        # is replaced rather than cleared, so a lookup that raced with a registry change is only stored
+        # in the cache of the version it was started from, which is already outdated.
+        emit_cache: tuple[int, dict[str, tuple[EventSubscriber, ...]]] = self.__emit_cache
+        if emit_cache[0] != version:
+            emit_cache = (version, {})
+            self.__emit_cache = emit_cache
+
+        # Reuse the cached subscribers if available. Otherwise, get the subscribers associated
+        # with the event, removing one-time subscribers. The lookup is only cached if the registry
+        # is still at the version read above, so lookups that removed one-time subscribers, or that
+        # raced with another change, are never reused by concurrent emissions. Empty lookups are
+        # not cached either, so that emitting arbitrary event names does not grow the cache.
+        subscribers: tuple[EventSubscriber, ...] | None = emit_cache[1].get(event_name)
+        if subscribers is None:
+            subscribers = tuple(
+                event_linker.get_subscribers_from_events(event_name, Ellipsis, pop_onetime_subscribers=True)
+            )
+            if subscribers and event_linker.get_version() == version:
+                emit_cache[1][event_name] = subscribers
 
         # If there are no subscribers for the event, log a
         # debug message if debug mode is enabled and exit.
         if not subscribers:
-            if self.__logger.debug_enabled:
-                self.__logger.debug(action="Emitting:", msg=f"No subscribers registered for the event '{event_name}'.")
+            if debug:
+                self._log_emission(event_name=event_name, event_emission=None)
             return
 
         # Create a new EventEmission instance to handle the event propagation.
         event_emission = EventEmitter.EventEmission(
             event=event_name,
             subscribers=subscribers,
-            args=(args if isinstance(event, str | EllipsisType) else (event, *args)),
+            args=(args if is_named_event else (event, *args)),
             kwargs=kwargs,
-            debug=self.__logger.debug_enabled,
+            debug=debug,
         )
 
         # Log the event emission if debug mode is enabled.
-        if self.__logger.debug_enabled:
-            self.__logger.debug(action="Emitting:", msg=f"{event_emission}")
+        if debug:
+            self._log_emission(event_name=event_name, event_emission=event_emission)
 
         # Delegate the event emission execution to the event processor.
         self.__event_processor.submit(event_emission)
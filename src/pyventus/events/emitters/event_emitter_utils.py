@@ -3,6 +3,7 @@ from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any
 
+from ...core.exceptions import PyventusException
 from ..linkers import EventLinker
 from .event_emitter import EventEmitter
 
@@ -96,7 +97,8 @@ def ExecutorEventEmitterCtx(  # noqa: N802
     Context manager that creates an `EventEmitter` instance configured with the `ExecutorProcessingService`.
 
     This context manager yields an `EventEmitter` instance, which can be used within a `with` statement.
-    Upon exiting the context, the processing service is properly shut down.
+    Upon exiting the context, whether normally or due to an exception, the processing service is
+    properly shut down.
 
     :param executor: The executor object used to handle the execution of event emissions. If `None`,
         a `ThreadPoolExecutor` with default settings will be created.
@@ -110,30 +112,33 @@ def ExecutorEventEmitterCtx(  # noqa: N802
 
     processing_service = ExecutorProcessingService(executor=(executor if executor else ThreadPoolExecutor()))
 
-    yield EventEmitter(
-        event_processor=processing_service,
-        event_linker=event_linker,
-        debug=debug,
-    )
+    try:
+        yield EventEmitter(
+            event_processor=processing_service,
+            event_linker=event_linker,
+            debug=debug,
+        )
+    finally:
+        # Shut down the processing service even if the context block raised.
+        processing_service.shutdown()
 
-    processing_service.shutdown()
 
+_fastapi_event_emitter_dependencies: dict[tuple[type[EventLinker], bool | None], Callable[[Any], EventEmitter]] = {}
+"""The memoized `FastAPIEventEmitter` dependency callables, keyed by their event linker and debug mode."""
 
-def FastAPIEventEmitter(  # noqa: N802
-    event_linker: type[EventLinker] = EventLinker,
-    debug: bool | None = None,
+
+def _create_fastapi_event_emitter_dependency(
+    event_linker: type[EventLinker],
+    debug: bool | None,
 ) -> Callable[[Any], EventEmitter]:
     """
-    Create an `EventEmitter` instance configured with the `FastAPIProcessingService`.
-
-    This function is compatible with FastAPI's dependency injection system and should be
-    used with the `Depends` method to automatically provide the `BackgroundTasks` instance.
+    Create the FastAPI dependency callable that builds an `EventEmitter` with the `FastAPIProcessingService`.
 
     :param event_linker: Specifies the type of event linker used to manage and access events along with their
-        corresponding subscribers. Defaults to `EventLinker`.
+        corresponding subscribers.
     :param debug: Specifies the debug mode for the logger. If `None`, it is determined based on the
         execution environment.
-    :return: An instance of `EventEmitter` configured with the `FastAPIProcessingService`.
+    :return: A callable that creates an `EventEmitter` from the FastAPI `BackgroundTasks` object.
     """
     from fastapi import BackgroundTasks
 
@@ -157,6 +162,42 @@ def FastAPIEventEmitter(  # noqa: N802
     return create_event_emitter
 
 
+def FastAPIEventEmitter(  # noqa: N802
+    event_linker: type[EventLinker] = EventLinker,
+    debug: bool | None = None,
+) -> Callable[[Any], EventEmitter]:
+    """
+    Create an `EventEmitter` instance configured with the `FastAPIProcessingService`.
+
+    This function is compatible with FastAPI's dependency injection system and should be
+    used with the `Depends` method to automatically provide the `BackgroundTasks` instance.
+    Calls with the same arguments return the same dependency callable, allowing FastAPI to
+    reuse a single `EventEmitter` per request across all dependencies that declare it.
+
+    :param event_linker: Specifies the type of event linker used to manage and access events along with their
+        corresponding subscribers. Defaults to `EventLinker`.
+    :param debug: Specifies the debug mode for the logger. If `None`, it is determined based on the
+        execution environment.
+    :return: An instance of `EventEmitter` configured with the `FastAPIProcessingService`.
+    :raises PyventusException: If the `event_linker` or `debug` arguments are invalid.
+    """
+    # Validate the arguments upfront, as they are used as memoization keys.
+    if event_linker is None or not isinstance(event_linker, type) or not issubclass(event_linker, EventLinker):
+        raise PyventusException("The 'event_linker' argument must be a subtype of the EventLinker class.")
+
+    if debug is not None and not isinstance(debug, bool):
+        raise PyventusException("The 'debug' argument must be a boolean value.")
+
+    # Retrieve the memoized dependency callable, or create and memoize a new one
+    key: tuple[type[EventLinker], bool | None] = (event_linker, debug)
+    dependency: Callable[[Any], EventEmitter] | None = _fastapi_event_emitter_dependencies.get(key)
+    if dependency is None:
+        dependency = _fastapi_event_emitter_dependencies.setdefault(
+            key, _create_fastapi_event_emitter_dependency(event_linker=event_linker, debug=debug)
+        )
+    return dependency
+
+
 def RedisEventEmitter(  # noqa: N802
     queue: Any,
     options: dict[str, Any] | None = None,
@@ -192,13 +192,20 @@ class EventLinker:
             # is stateful; otherwise, return just the callback.
             return (callback, self) if is_stateful else callback
 
-    __registry: MultiBidict[str, EventSubscriber] = MultiBidict[str, EventSubscriber]()
+    __registry: MultiBidict[str, EventSubscriber] = MultiBidict()
     """
     A registry that serves as a container for storing events and their associated subscribers. It 
     utilizes an optimized data structure that enables quick lookups, updates, and even deletions 
     of events and their subscribers.
     """
 
+    __version: int = 0
+    """
+    A monotonically increasing counter that is incremented each time the main registry is
+    modified. It allows consumers, such as event emitters, to detect registry changes and
+    safely reuse the results of previous lookups.
+    """
+
     __max_subscribers: int | None = None
     """The maximum number of subscribers allowed per event, or `None` if there is no limit."""
 
@@ -254,8 +261,12 @@ class EventLinker:
             callbacks are invalid.
         :return: None.
         """
-        # Initialize the main registry
-        cls.__registry = MultiBidict[str, EventSubscriber]()
+        # Initialize the main registry. The generic parameters come from the class
+        # annotation, so no parameterized generic alias is created at runtime.
+        cls.__registry = MultiBidict()
+
+        # Initialize the registry version
+        cls.__version = 0
 
         # Create a lock object for thread synchronization
         cls.__thread_lock = Lock()
@@ -309,6 +320,12 @@ class EventLinker:
         """
         if not events:
             raise PyventusException("The 'events' argument cannot be None or empty.")
+
+        # Handle the common single-event case directly, as there is
+        # nothing to deduplicate and no comprehension is needed
+        if len(events) == 1:
+            return {cls.get_valid_event_name(events[0])}
+
         return {cls.get_valid_event_name(event) for event in events}
 
     @classmethod
@@ -369,6 +386,18 @@ class EventLinker:
             raise PyventusException("The 'subscriber' argument must be an instance of EventSubscriber.")
         return subscriber
 
+    @classmethod
+    def get_version(cls) -> int:
+        """
+        Retrieve the current version of the main registry.
+
+        The version is incremented each time the registry is modified, so two
+        equal versions guarantee that no modification occurred in between.
+
+        :return: The current version of the main registry.
+        """
+        return cls.__version
+
     @classmethod
     def get_max_subscribers(cls) -> int | None:
         """
@@ -496,10 +525,11 @@ class EventLinker:
             if not pop_onetime_subscribers:
                 return subscribers
 
-            # Remove one-time subscribers from the registry
-            for subscriber in subscribers:
-                if subscriber.once:
-                    cls.__registry.remove_value(subscriber)
+            # Collect the one-time subscribers and remove them from the registry in a single batch
+            onetime_subscribers: set[EventSubscriber] = {subscriber for subscriber in subscribers if subscriber.once}
+            if onetime_subscribers:
+                cls.__registry.remove_values(onetime_subscribers)
+                cls.__version += 1
 
         # Return the set of subscribers
         return subscribers
@@ -592,7 +622,9 @@ class EventLinker:
             block to prevent memory leaks. The term 'subctx' refers to 'Subscription Context'.
         :return: A `EventLinkerSubCtx` instance.
         """
-        return EventLinker.EventLinkerSubCtx[type[Self]](
+        # The generic parameter is inferred from the event linker, so the context class is instantiated
+        # directly, avoiding the creation of a parameterized generic alias on every call.
+        return EventLinker.EventLinkerSubCtx(
             events=events, event_linker=cls, force_async=force_async, once=True, is_stateful=stateful_subctx
         )
 
@@ -620,7 +652,9 @@ class EventLinker:
             block to prevent memory leaks. The term 'subctx' refers to 'Subscription Context'.
         :return: A `EventLinkerSubCtx` instance.
         """
-        return EventLinker.EventLinkerSubCtx[type[Self]](
+        # The generic parameter is inferred from the event linker, so the context class is instantiated
+        # directly, avoiding the creation of a parameterized generic alias on every call.
+        return EventLinker.EventLinkerSubCtx(
             events=events, event_linker=cls, force_async=force_async, once=False, is_stateful=stateful_subctx
         )
 
@@ -651,6 +685,17 @@ class EventLinker:
         # Validate and retrieve all unique event names
         unique_events: set[str] = cls._get_valid_and_unique_event_names(events)
 
+        # Create a new event subscriber. This is done before acquiring the lock,
+        # as it only validates and wraps the given callbacks.
+        subscriber: EventSubscriber = EventSubscriber(
+            teardown_callback=cls.remove_subscriber,
+            event_callback=event_callback,
+            success_callback=success_callback if success_callback else cls.__default_success_callback,
+            failure_callback=failure_callback if failure_callback else cls.__default_failure_callback,
+            force_async=force_async,
+            once=once,
+        )
+
         # Acquire the lock to ensure exclusive access to the main registry
         with cls.__thread_lock:
             # Check if the maximum number of subscribers is set
@@ -663,19 +708,11 @@ class EventLinker:
                             f"The event '{event}' has exceeded the maximum number of subscribers allowed."
                         )
 
-            # Create a new event subscriber
-            subscriber: EventSubscriber = EventSubscriber(
-                teardown_callback=cls.remove_subscriber,
-                event_callback=event_callback,
-                success_callback=success_callback if success_callback else cls.__default_success_callback,
-                failure_callback=failure_callback if failure_callback else cls.__default_failure_callback,
-                force_async=force_async,
-                once=once,
-            )
+            # Register the subscriber for all the unique events at once
+            cls.__registry.insert_keys(unique_events, subscriber)
 
-            # Register the subscriber for each unique event
-            for event in unique_events:
-                cls.__registry.insert(event, subscriber)
+            # Increment the registry version
+            cls.__version += 1
 
         # Log the subscription if debug is enabled
         if cls.__logger.debug_enabled:
@@ -710,6 +747,9 @@ class EventLinker:
             # Remove the subscriber from the event
             cls.__registry.remove(valid_event, valid_subscriber)
 
+            # Increment the registry version
+            cls.__version += 1
+
         # Log the removal if the debug mode is enabled
         if cls.__logger.debug_enabled:
             cls.__logger.debug(
@@ -739,6 +779,9 @@ class EventLinker:
             # Remove the event from the registry
             cls.__registry.remove_key(valid_event)
 
+            # Increment the registry version
+            cls.__version += 1
+
         # Log the removal if the debug mode is enabled
         if cls.__logger.debug_enabled:
             cls.__logger.debug(action="Removed:", msg=f"Event: '{valid_event}'")
@@ -766,6 +809,9 @@ class EventLinker:
             # Remove the subscriber from the registry
             cls.__registry.remove_value(valid_subscriber)
 
+            # Increment the registry version
+            cls.__version += 1
+
         # Log the removal if the debug mode is enabled
         if cls.__logger.debug_enabled:
             cls.__logger.debug(action="Removed:", msg=f"{valid_subscriber}")
@@ -789,6 +835,9 @@ class EventLinker:
             # Clear the registry
             cls.__registry.clear()
 
+            # Increment the registry version
+            cls.__version += 1
+
         if cls.__logger.debug_enabled:
             cls.__logger.debug(action="Removed:", msg="All events and subscribers.")
 
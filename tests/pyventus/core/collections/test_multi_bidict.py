@@ -321,6 +321,47 @@ class TestMultiBidict:
         assert populated_multibidict.key_count == expected_key_count
         assert populated_multibidict.value_count == expected_value_count
 
+    # =================================
+    # Test Cases for insert_keys
+    # =================================
+
+    def test_insert_keys_when_empty(self, empty_multibidict: MultiBidict[str, str]) -> None:
+        # Arrange/Act
+        empty_multibidict.insert_keys(set(), "Green")
+        empty_multibidict.insert_keys({"Apple", "Pear"}, "Green")
+        empty_multibidict.insert_keys({"Apple"}, "Red")
+
+        # Assert
+        assert empty_multibidict.to_dict() == {"Apple": {"Green", "Red"}, "Pear": {"Green"}}
+        assert empty_multibidict.get_keys_from_values({"Green"}) == {"Apple", "Pear"}
+
+    # =================================
+
+    @pytest.mark.parametrize(
+        ["keys", "value", "expected_key_count", "expected_value_count"],
+        [
+            (set(), "Blue", 4, 4),  # No keys; counts unchanged
+            ({"Apple", "Banana"}, "Green", 4, 4),  # Existing keys and value; counts unchanged
+            ({"Apple", "Orange"}, "Blue", 5, 5),  # New key and value; both counts increase
+            ({"Orange", "Lemon"}, "Yellow", 6, 4),  # New keys with existing value; key count increases
+        ],
+    )
+    def test_insert_keys_when_populated(
+        self,
+        keys: set[str],
+        value: str,
+        expected_key_count: int,
+        expected_value_count: int,
+        populated_multibidict: MultiBidict[str, str],
+    ) -> None:
+        # Arrange/Act
+        populated_multibidict.insert_keys(keys, value)
+
+        # Assert
+        assert all(populated_multibidict.are_associated(key, value) for key in keys)
+        assert populated_multibidict.key_count == expected_key_count
+        assert populated_multibidict.value_count == expected_value_count
+
     # =================================
     # Test Cases for remove
     # =================================
@@ -423,6 +464,53 @@ class TestMultiBidict:
         assert populated_multibidict.key_count == expected_key_count
         assert populated_multibidict.value_count == expected_value_count
 
+    # =================================
+    # Test Cases for remove_values
+    # =================================
+
+    def test_remove_values_when_empty(self, empty_multibidict: MultiBidict[str, str]) -> None:
+        # Arrange, Act, Assert
+        with pytest.raises(KeyError):
+            empty_multibidict.remove_values({"Any"})
+
+    # =================================
+
+    def test_remove_values_with_unregistered_value(self, populated_multibidict: MultiBidict[str, str]) -> None:
+        # Arrange
+        expected_dict = populated_multibidict.to_dict()
+
+        # Act/Assert
+        with pytest.raises(KeyError):
+            populated_multibidict.remove_values({"Red", "Green", "Yellow", "Purple", "Any"})
+        assert populated_multibidict.to_dict() == expected_dict
+        assert populated_multibidict.value_count == 4
+
+    # =================================
+
+    @pytest.mark.parametrize(
+        ["values", "expected_key_count", "expected_value_count"],
+        [
+            (set(), 4, 4),  # Remove nothing; counts remain the same
+            ({"Red"}, 4, 3),  # Remove unique value with shared key; value count decreases
+            ({"Red", "Green"}, 2, 2),  # Remove values covering a whole key; both counts decrease
+            ({"Green", "Yellow", "Purple"}, 1, 1),  # Remove values spanning several keys; both counts decrease
+        ],
+    )
+    def test_remove_values_when_populated(
+        self,
+        values: set[str],
+        expected_key_count: int,
+        expected_value_count: int,
+        populated_multibidict: MultiBidict[str, str],
+    ) -> None:
+        # Arrange/Act
+        populated_multibidict.remove_values(values)
+
+        # Assert
+        assert populated_multibidict.key_count == expected_key_count
+        assert populated_multibidict.value_count == expected_value_count
+        assert not any(populated_multibidict.contains_value(value) for value in values)
+
     # =================================
     # Test Cases for pop_key
     # =================================
@@ -1,5 +1,10 @@
+from asyncio import AbstractEventLoop, Task, get_running_loop
+from collections.abc import Coroutine
+from sys import version_info
 from typing import Any
 
+import pytest
+from pyventus import PyventusException
 from pyventus.core.processing.asyncio import AsyncIOProcessingService
 from typing_extensions import override
 
@@ -20,6 +25,25 @@ class TestAsyncIOProcessingService(ProcessingServiceTest):
         assert processing_service is not None
         assert isinstance(processing_service, AsyncIOProcessingService)
 
+    # =================================
+
+    @pytest.mark.parametrize(["eager_start"], [(True,), (False,)])
+    def test_creation_with_valid_eager_start(self, eager_start: bool) -> None:
+        # Arrange/Act
+        processing_service = AsyncIOProcessingService(eager_start=eager_start)
+
+        # Assert
+        assert processing_service is not None
+        assert isinstance(processing_service, AsyncIOProcessingService)
+
+    # =================================
+
+    @pytest.mark.parametrize(["eager_start"], [(None,), (1,), ("True",)])
+    def test_creation_with_invalid_eager_start(self, eager_start: Any) -> None:
+        # Arrange/Act/Assert
+        with pytest.raises(PyventusException):
+            AsyncIOProcessingService(eager_start=eager_start)
+
     # =================================
     # Test Cases for is_loop_running
     # =================================
@@ -62,3 +86,51 @@ class TestAsyncIOProcessingService(ProcessingServiceTest):
         # Act
         processing_service.submit(callback, *args, **kwargs)
         await processing_service.wait_for_tasks()
+
+    # =================================
+
+    async def test_submission_with_eager_start_in_async_context(self) -> None:
+        # Arrange
+        processing_service = AsyncIOProcessingService(eager_start=True)
+        callback = CallableMock.Async()
+
+        # Act
+        processing_service.submit(callback, "str", 0, str=...)
+
+        # Assert: The callback only starts immediately where eager tasks are supported.
+        assert callback.call_count == (1 if version_info >= (3, 12) else 0)
+
+        # Act: Wait for the remaining tasks to complete.
+        await processing_service.wait_for_tasks()
+
+        # Assert
+        assert callback.call_count == 1
+        assert callback.last_args == ("str", 0)
+        assert callback.last_kwargs == {"str": ...}
+
+    # =================================
+
+    async def test_submission_with_eager_start_and_custom_task_factory(self) -> None:
+        # Arrange
+        created_tasks: list[Task[Any]] = []
+
+        def task_factory(loop: AbstractEventLoop, coro: Coroutine[Any, Any, Any], **kwargs: Any) -> Task[Any]:
+            task: Task[Any] = Task(coro, loop=loop, **kwargs)
+            created_tasks.append(task)
+            return task
+
+        loop = get_running_loop()
+        loop.set_task_factory(task_factory)  # type: ignore[arg-type]
+        processing_service = AsyncIOProcessingService(eager_start=True)
+        callback = CallableMock.Async()
+
+        # Act
+        try:
+            processing_service.submit(callback)
+            await processing_service.wait_for_tasks()
+        finally:
+            loop.set_task_factory(None)
+
+        # Assert
+        assert len(created_tasks) == 1
+        assert callback.call_count == 1
@@ -1,3 +1,5 @@
+from asyncio import AbstractEventLoop, CancelledError, create_task, get_running_loop, sleep
+from collections.abc import AsyncGenerator
 from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
@@ -76,6 +78,81 @@ class TestExecutorProcessingService(ProcessingServiceTest):
         # Assert
         assert executor._shutdown is True
 
+    # =================================
+    # Test Cases for event loop reuse
+    # =================================
+
+    def test_event_loop_reuse_within_worker_thread(self) -> None:
+        # Arrange
+        loops: list[AbstractEventLoop] = []
+
+        async def callback() -> None:
+            loops.append(get_running_loop())
+
+        # Act
+        with ExecutorProcessingService(executor=ThreadPoolExecutor(max_workers=1)) as processing_service:
+            processing_service.submit(callback)
+            processing_service.submit(callback)
+
+        # Assert
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert not loops[0].is_running()
+
+    # =================================
+
+    def test_pending_tasks_cancellation_after_submission(self) -> None:
+        # Arrange
+        cancelled: list[bool] = []
+
+        async def pending_task() -> None:
+            try:
+                await sleep(60)
+            except CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def callback() -> None:
+            create_task(pending_task())
+            await sleep(0)
+
+        # Act
+        with ExecutorProcessingService(executor=ThreadPoolExecutor(max_workers=1)) as processing_service:
+            processing_service.submit(callback)
+
+        # Assert
+        assert cancelled == [True]
+
+    # =================================
+
+    def test_async_generators_closing_after_submission(self) -> None:
+        # Arrange
+        closed: list[int] = []
+        closed_on_call: list[list[int]] = []
+        suspended: list[AsyncGenerator[int, None]] = []
+
+        async def async_generator(value: int) -> AsyncGenerator[int, None]:
+            try:
+                yield value
+                yield value
+            finally:
+                closed.append(value)
+
+        async def callback(value: int) -> None:
+            closed_on_call.append(closed.copy())
+            asyncgen = async_generator(value)
+            suspended.append(asyncgen)  # Keep a reference, so it is not closed by the garbage collector
+            await anext(asyncgen)
+
+        # Act
+        with ExecutorProcessingService(executor=ThreadPoolExecutor(max_workers=1)) as processing_service:
+            processing_service.submit(callback, 0)
+            processing_service.submit(callback, 1)
+
+        # Assert
+        assert closed_on_call == [[], [0]]
+        assert closed == [0, 1]
+
     # =================================
     # Test Cases for submission
     # =================================
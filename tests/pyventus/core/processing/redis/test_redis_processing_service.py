@@ -48,6 +48,56 @@ class TestRedisProcessingService(ProcessingServiceTest):
         with pytest.raises(exception):
             RedisProcessingService(queue=queue, options=options)
 
+    # =================================
+    # Test Cases for batch submission
+    # =================================
+
+    def test_batch_submission(self) -> None:
+        # Arrange
+        queue = Queue(connection=FakeStrictRedis())
+        processing_service = RedisProcessingService(queue=queue)
+
+        # Act/Assert
+        with processing_service.batch():
+            processing_service.submit(CallableMock.Sync(), "str", 0)
+            with processing_service.batch():
+                processing_service.submit(CallableMock.Sync(), str=...)
+            assert queue.count == 0
+        assert queue.count == 2
+
+        processing_service.submit(CallableMock.Sync())
+        assert queue.count == 3
+
+    # =================================
+
+    def test_batch_submission_with_exception(self) -> None:
+        # Arrange
+        queue = Queue(connection=FakeStrictRedis())
+        processing_service = RedisProcessingService(queue=queue)
+
+        # Act
+        with pytest.raises(ValueError):
+            with processing_service.batch():
+                processing_service.submit(CallableMock.Sync())
+                raise ValueError()
+
+        # Assert
+        assert queue.count == 1
+
+    # =================================
+
+    def test_batch_submission_with_pipeline_option(self) -> None:
+        # Arrange
+        queue = Queue(connection=FakeStrictRedis())
+        processing_service = RedisProcessingService(queue=queue, options={"pipeline": queue.connection.pipeline()})
+
+        # Act
+        with processing_service.batch():
+            processing_service.submit(CallableMock.Sync())
+
+        # Assert
+        assert queue.count == 1
+
     # =================================
     # Test Cases for submission
     # =================================
@@ -1,8 +1,13 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
+from gc import collect
+from threading import Event, Thread, current_thread
 from types import EllipsisType
 from typing import Any
+from uuid import UUID
+from weakref import ref
 
 import pytest
 from pyventus import PyventusException
@@ -11,6 +16,7 @@ from pyventus.core.processing.asyncio import AsyncIOProcessingService
 from pyventus.events import EmittableEventType, EventEmitter, EventLinker, SubscribableEventType
 
 from ....fixtures import CallableMock, EventFixtures
+from ....utils import get_private_attr
 
 
 class TestEventEmitter:
@@ -63,6 +69,49 @@ class TestEventEmitter:
         with pytest.raises(PyventusException):
             EventEmitter(event_processor=event_processor, event_linker=event_linker, debug=debug)
 
+    # =================================
+    # Test Cases for EventEmission
+    # =================================
+
+    def test_event_emission_id(self) -> None:
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        subscriber = IsolatedEventLinker.subscribe("StrEvent", event_callback=CallableMock.Sync())
+        event_emission = EventEmitter.EventEmission(
+            event="StrEvent", subscribers=(subscriber,), args=(), kwargs={}, debug=False
+        )
+
+        # Act
+        id_before_access = get_private_attr(event_emission, "__id")
+        event_emission_id = event_emission.id
+
+        # Assert
+        assert id_before_access is None
+        assert event_emission.id == event_emission_id
+        assert UUID(event_emission_id).version == 4
+        assert str(UUID(event_emission_id)) == event_emission_id
+        assert event_emission_id in repr(event_emission)
+
+    # =================================
+
+    def test_event_emission_timestamp(self) -> None:
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        subscriber = IsolatedEventLinker.subscribe("StrEvent", event_callback=CallableMock.Sync())
+
+        # Act
+        before = datetime.now()
+        event_emission = EventEmitter.EventEmission(
+            event="StrEvent", subscribers=(subscriber,), args=(), kwargs={}, debug=False
+        )
+        after = datetime.now()
+
+        # Assert
+        assert before <= event_emission.timestamp <= after
+        assert event_emission.timestamp == event_emission.timestamp
+
     # =================================
     # Test Cases for event emission
     # =================================
@@ -322,6 +371,135 @@ class TestEventEmitter:
         with pytest.raises(exception):
             event_emitter.emit(tc.emission_event, *tc.emission_args, **tc.emission_kwargs)
 
+    # =================================
+
+    def test_emit_with_registry_changes_between_emissions(self) -> None:
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        callback1 = CallableMock.Sync()
+        callback2 = CallableMock.Sync()
+        callback3 = CallableMock.Sync()
+        subscriber1 = IsolatedEventLinker.subscribe("StrEvent", event_callback=callback1)
+        event_emitter = EventEmitter(event_processor=AsyncIOProcessingService(), event_linker=IsolatedEventLinker)
+
+        # Act/Assert
+        event_emitter.emit("StrEvent")
+        event_emitter.emit("StrEvent")
+        assert callback1.call_count == 2
+
+        IsolatedEventLinker.subscribe("StrEvent", event_callback=callback2, once=True)
+        event_emitter.emit("StrEvent")
+        event_emitter.emit("StrEvent")
+        assert callback1.call_count == 4
+        assert callback2.call_count == 1
+
+        IsolatedEventLinker.subscribe(..., event_callback=callback3)
+        IsolatedEventLinker.remove_subscriber(subscriber1)
+        event_emitter.emit("StrEvent")
+        assert callback1.call_count == 4
+        assert callback3.call_count == 1
+
+    # =================================
+
+    def test_emit_without_references_to_removed_subscribers(self) -> None:
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        callback = CallableMock.Sync()
+        callback_ref = ref(callback)
+        IsolatedEventLinker.subscribe("StrEvent", event_callback=callback)
+        event_emitter = EventEmitter(event_processor=AsyncIOProcessingService(), event_linker=IsolatedEventLinker)
+        event_emitter.emit("StrEvent")
+        assert callback.call_count == 1
+
+        # Act
+        del callback
+        IsolatedEventLinker.remove_all()
+        event_emitter.emit("OtherEvent")
+        collect()
+
+        # Assert
+        assert callback_ref() is None
+
+    # =================================
+
+    def test_emit_with_onetime_subscribers_from_concurrent_threads(self) -> None:
+        # Arrange
+        version_read = Event()
+        lookup_done = Event()
+        calls: list[str] = []
+
+        class IsolatedEventLinker(EventLinker):
+            @classmethod
+            def get_version(cls) -> int:
+                # Pause the second emitter thread right after it reads the registry
+                # version, until the first emission has completed its lookup.
+                version = super().get_version()
+                if current_thread().name == "paused-emitter":
+                    version_read.set()
+                    lookup_done.wait(timeout=5)
+                return version
+
+        IsolatedEventLinker.subscribe("StrEvent", event_callback=lambda: calls.append("once"), once=True)
+        IsolatedEventLinker.subscribe("StrEvent", event_callback=lambda: calls.append("regular"))
+        event_emitter = EventEmitter(event_processor=AsyncIOProcessingService(), event_linker=IsolatedEventLinker)
+
+        def emit_after_version_read() -> None:
+            version_read.wait(timeout=5)
+            event_emitter.emit("StrEvent")
+            lookup_done.set()
+
+        paused_emitter = Thread(target=lambda: event_emitter.emit("StrEvent"), name="paused-emitter")
+        other_emitter = Thread(target=emit_after_version_read)
+
+        # Act
+        paused_emitter.start()
+        other_emitter.start()
+        paused_emitter.join()
+        other_emitter.join()
+
+        # Assert
+        assert sorted(calls) == ["once", "regular", "regular"]
+
+    # =================================
+
+    @pytest.mark.parametrize(
+        ["event_callback", "success_callback", "failure_callback"],
+        [
+            (CallableMock.Sync(), CallableMock.Sync(raise_exception=ValueError()), None),
+            (CallableMock.Sync(raise_exception=ValueError()), None, CallableMock.Sync(raise_exception=ValueError())),
+            (CallableMock.Async(), CallableMock.Async(raise_exception=ValueError()), None),
+            (CallableMock.Async(raise_exception=ValueError()), None, CallableMock.Async(raise_exception=ValueError())),
+        ],
+    )
+    def test_emit_with_single_subscriber_and_raising_callbacks(
+        self,
+        event_callback: CallableMock.Base,
+        success_callback: CallableMock.Base | None,
+        failure_callback: CallableMock.Base | None,
+    ) -> None:
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        IsolatedEventLinker.subscribe(
+            "StrEvent",
+            event_callback=event_callback,
+            success_callback=success_callback,
+            failure_callback=failure_callback,
+        )
+        event_emitter = EventEmitter(event_processor=AsyncIOProcessingService(), event_linker=IsolatedEventLinker)
+
+        # Act
+        event_emitter.emit("StrEvent")
+
+        # Assert
+        assert event_callback.call_count == 1
+        if success_callback is not None:
+            assert success_callback.call_count == 1
+        if failure_callback is not None:
+            assert failure_callback.call_count == 1
+
     @contextmanager
     def event_emission_test(
         self, event_processor: ProcessingService, event_linker: type[EventLinker]
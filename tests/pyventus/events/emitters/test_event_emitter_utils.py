@@ -1,3 +1,7 @@
+from typing import Any
+
+import pytest
+from pyventus import PyventusException
 from pyventus.events import (
     AsyncIOEventEmitter,
     CeleryEventEmitter,
@@ -122,6 +126,22 @@ class TestEventEmitterUtils:
         assert logger.debug_enabled is True
         assert executor._shutdown is True
 
+    # =================================
+
+    def test_ExecutorEventEmitterCtx_with_exception(self) -> None:  # noqa: N802
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Arrange
+        executor = ThreadPoolExecutor()
+
+        # Act
+        with pytest.raises(ValueError):
+            with ExecutorEventEmitterCtx(executor=executor):
+                raise ValueError()
+
+        # Assert
+        assert executor._shutdown is True
+
     # =================================
     # Test Cases for FastAPIEventEmitter
     # =================================
@@ -157,6 +177,38 @@ class TestEventEmitterUtils:
 
         assert client.get("/").status_code == HTTP_200_OK
 
+    # =================================
+
+    def test_FastAPIEventEmitter_with_same_arguments(self) -> None:  # noqa: N802
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        # Act
+        dependency1 = FastAPIEventEmitter(event_linker=IsolatedEventLinker, debug=True)
+        dependency2 = FastAPIEventEmitter(event_linker=IsolatedEventLinker, debug=True)
+        dependency3 = FastAPIEventEmitter(event_linker=IsolatedEventLinker, debug=False)
+
+        # Assert
+        assert dependency1 is dependency2
+        assert dependency1 is not dependency3
+
+    # =================================
+
+    @pytest.mark.parametrize(
+        ["event_linker", "debug"],
+        [
+            (None, None),
+            (object, None),
+            ([], None),
+            (EventLinker, "True"),
+            (EventLinker, []),
+        ],
+    )
+    def test_FastAPIEventEmitter_with_invalid_input(self, event_linker: Any, debug: Any) -> None:  # noqa: N802
+        # Arrange/Act/Assert
+        with pytest.raises(PyventusException):
+            FastAPIEventEmitter(event_linker=event_linker, debug=debug)
+
     # =================================
     # Test Cases for RedisEventEmitter
     # =================================
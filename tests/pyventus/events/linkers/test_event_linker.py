@@ -254,6 +254,47 @@ class TestEventLinker:
             != IsolatedEventLinker2.get_registry()
         )
 
+    # =================================
+    # Test Cases for get_version()
+    # =================================
+
+    def test_get_version_when_modified(self) -> None:
+        # Arrange
+        class IsolatedEventLinker(EventLinker): ...
+
+        version = IsolatedEventLinker.get_version()
+
+        # Act/Assert
+        sub1 = IsolatedEventLinker.subscribe("A", "B", event_callback=CallableMock.Sync())
+        assert IsolatedEventLinker.get_version() > version
+        version = IsolatedEventLinker.get_version()
+
+        sub2 = IsolatedEventLinker.subscribe("C", event_callback=CallableMock.Sync(), once=True)
+        assert IsolatedEventLinker.get_version() > version
+        version = IsolatedEventLinker.get_version()
+
+        IsolatedEventLinker.get_subscribers_from_events("A", "B", pop_onetime_subscribers=True)
+        assert IsolatedEventLinker.get_version() == version
+
+        IsolatedEventLinker.get_subscribers_from_events("C", pop_onetime_subscribers=True)
+        assert IsolatedEventLinker.get_version() > version
+        version = IsolatedEventLinker.get_version()
+
+        assert not IsolatedEventLinker.remove_subscriber(sub2)
+        assert IsolatedEventLinker.get_version() == version
+
+        assert IsolatedEventLinker.remove("A", sub1)
+        assert IsolatedEventLinker.get_version() > version
+        version = IsolatedEventLinker.get_version()
+
+        assert IsolatedEventLinker.remove_event("B")
+        assert IsolatedEventLinker.get_version() > version
+        version = IsolatedEventLinker.get_version()
+
+        IsolatedEventLinker.subscribe("D", event_callback=CallableMock.Sync())
+        assert IsolatedEventLinker.remove_all()
+        assert IsolatedEventLinker.get_version() > version
+
     # =================================
     # Test Cases for get_valid_event_name()
     # =================================
@@ -329,6 +370,8 @@ class TestEventLinker:
     @pytest.mark.parametrize(
         ["events", "expected"],
         [
+            (("A",), {"A"}),
+            ((EventFixtures.EmptyDtc,), {EventFixtures.EmptyDtc.__name__}),
             ((Ellipsis, ...), {EllipsisType.__name__}),
             (("A", "B", "C", "B", "A"), {"A", "B", "C"}),
             (